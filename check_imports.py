@@ -1,7 +1,12 @@
-import importlib, traceback, sys
+import importlib, importlib.util, traceback, sys
 modules = ['src_python.database', 'src_python.models', 'src_python.utils', 'src_python.pipeline', 'src_python.llm_client']
+# --quick: only resolve the modules (find_spec) without executing them (no DB engine / OCR setup)
+quick = '--quick' in sys.argv[1:]
 for m in modules:
     try:
+        if quick:
+            print(f"{m} found" if importlib.util.find_spec(m) else f"{m} missing")
+            continue
         importlib.import_module(m)
         print(f"{m} imported OK")
     except Exception as e:
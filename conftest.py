@@ -0,0 +1,15 @@
+"""
+Pytest fixture'ları - test_new_features.py pytest olmadan da çalışabilsin diye burada
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def db_session():
+    """Modül boyunca tek DB oturumu (her test için yeniden açılmaz)"""
+    from src_python.database import SessionLocal
+    
+    db = SessionLocal()
+    yield db
+    db.close()
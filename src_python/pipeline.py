@@ -8,6 +8,8 @@ import re
 import json
 import platform
 import warnings
+from datetime import datetime
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any, Callable
 
@@ -22,6 +24,7 @@ from PyPDF2 import PdfReader
 from sqlalchemy.orm import Session
 import cv2
 import numpy as np
+import pandas as pd
 
 from database import SessionLocal, get_db
 from models import AnalysisJob, Contract
@@ -61,6 +64,21 @@ pytesseract.pytesseract.tesseract_cmd = TESSERACT_CMD
 TESSERACT_CONFIG = "--oem 1 --psm 6"
 SCAN_DPI = 100  
 FINAL_DPI = 200 
+HASH_CHUNK_SIZE = 1024 * 1024  # 4 KB yerine 1 MB: büyük PDF'lerde çok daha az Python döngüsü
+
+@lru_cache(maxsize=8192)
+def _md5_file(path: str, mtime_ns: int, size: int) -> str:
+    # Anahtar (yol, mtime, boyut): dosya değişmedikçe tekrar okunmaz, değişirse yeni giriş açılır
+    hash_md5 = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            hash_md5.update(chunk)
+    return hash_md5.hexdigest()
+
+def _hash_file(path: str) -> str:
+    if not path.startswith("\\\\?\\"): path = os.path.abspath(path)  # göreli yollar cwd'ye göre farklı dosyalar olabilir
+    st = os.stat(path)
+    return _md5_file(path, st.st_mtime_ns, st.st_size)
 
 class PipelineManager:
     def __init__(self, log_callback: Optional[Callable[[str], None]] = None):
@@ -108,21 +126,13 @@ class PipelineManager:
         return path
 
     def calculate_file_hash(self, filepath: str) -> Optional[str]:
-        hash_md5 = hashlib.md5()
         try:
             # Safe path kullanıyoruz
-            safe_path = self._get_safe_path(filepath)
-            with open(safe_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            return _hash_file(self._get_safe_path(filepath))
         except Exception as e:
             # Fallback: Try original path if safe path fails
             try:
-                with open(filepath, "rb") as f:
-                    for chunk in iter(lambda: f.read(4096), b""):
-                        hash_md5.update(chunk)
-                return hash_md5.hexdigest()
+                return _hash_file(filepath)
             except Exception as e2:
                 logger.error(f"Hash calculation error: {e} | Fallback error: {e2}")
                 return None
@@ -718,7 +728,6 @@ class PipelineManager:
         finally: db.close()
 
     def export_to_excel(self, job_id, output_path):
-        import pandas as pd; from datetime import datetime
         db = SessionLocal()
         try:
             contracts = db.query(Contract).filter(Contract.job_id == job_id).all()
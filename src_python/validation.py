@@ -3,14 +3,38 @@ Multi-stage validation and confidence scoring system.
 Provides comprehensive quality checks for extracted contract data.
 """
 
+import inspect
 import re
+import sys
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, Iterable, List, Tuple, Optional
 from dataclasses import dataclass, field
 from logger import logger
 
 
-@dataclass
+# Patterns compiled once at import instead of per validation call
+_LONG_NUMBER_RE = re.compile(r'\d{5,}')
+_REPEATED_CHAR_RE = re.compile(r'(.)\1{4,}')
+_UNUSUAL_CHAR_RE = re.compile(r'[^\w\s\-\.\,\&]')
+_DIGIT_RE = re.compile(r'\d')
+
+# __slots__ for the result dataclasses where supported (Python 3.10+): no per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Same forms datetime.strptime(..., '%Y-%m-%d') accepts (incl. 1-digit month/day, space-padded day)
+_ISO_DATE_RE = re.compile(r'(\d\d\d\d)-(1[0-2]|0[1-9]|[1-9])-(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])')
+
+
+def _parse_iso_date(date_str: str) -> datetime:
+    """Fast equivalent of datetime.strptime(date_str, '%Y-%m-%d'); raises ValueError on bad input."""
+    match = _ISO_DATE_RE.fullmatch(date_str)
+    if not match:
+        raise ValueError(f"time data {date_str!r} does not match format '%Y-%m-%d'")
+    year, month, day = match.groups()
+    return datetime(int(year), int(month), int(day))
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationResult:
     """Result of a validation check."""
     field_name: str
@@ -21,7 +45,7 @@ class ValidationResult:
     score_adjustments: Dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class FieldValidation:
     """Complete validation result for all fields."""
     results: Dict[str, ValidationResult] = field(default_factory=dict)
@@ -50,6 +74,22 @@ class ContractValidator:
         'UAE', 'Saudi Arabia', 'Qatar', 'Egypt', 'South Africa', 'Canada', 'Mexico',
         'Brazil', 'Argentina', 'Australia', 'New Zealand', 'Russia', 'Ukraine'
     }
+    # Case-insensitive lookup table ('turkey', 'TURKEY' are valid too)
+    _VALID_COUNTRIES_CASEFOLD = frozenset(c.casefold() for c in VALID_COUNTRIES)
+    
+    # Field weights for the overall confidence score
+    CONFIDENCE_WEIGHTS = {
+        'party': 0.20,
+        'contract_type': 0.15,
+        'signed_date': 0.15,
+        'start_date': 0.10,
+        'end_date': 0.10,
+        'address': 0.10,
+        'country': 0.10,
+        'cross_validation': 0.05,
+        'ocr_quality': 0.025,
+        'llm_confidence': 0.025
+    }
     
     def __init__(self):
         self.logger = logger
@@ -74,13 +114,14 @@ class ContractValidator:
             FieldValidation with detailed results for each field
         """
         validation = FieldValidation()
+        current_year = datetime.now().year  # once per contract, not per date field
         
         # Stage 1: Individual field validation
         validation.results['party'] = self._validate_party(party)
         validation.results['contract_type'] = self._validate_contract_type(contract_type)
-        validation.results['signed_date'] = self._validate_date(signed_date, 'signed_date')
-        validation.results['start_date'] = self._validate_date(start_date, 'start_date')
-        validation.results['end_date'] = self._validate_date(end_date, 'end_date')
+        validation.results['signed_date'] = self._validate_date(signed_date, 'signed_date', current_year)
+        validation.results['start_date'] = self._validate_date(start_date, 'start_date', current_year)
+        validation.results['end_date'] = self._validate_date(end_date, 'end_date', current_year)
         validation.results['address'] = self._validate_address(address)
         validation.results['country'] = self._validate_country(country)
         
@@ -152,7 +193,7 @@ class ContractValidator:
         elif party.lower() in ['unknown', 'n/a', 'null', 'none']:
             issues.append("Party name is placeholder")
             confidence = 10.0
-        elif re.search(r'\d{5,}', party):
+        elif _LONG_NUMBER_RE.search(party):
             warnings.append("Party name contains long number sequence")
             confidence = 70.0
         
@@ -185,7 +226,7 @@ class ContractValidator:
             warnings=warnings
         )
     
-    def _validate_date(self, date_str: str, field_name: str) -> ValidationResult:
+    def _validate_date(self, date_str: str, field_name: str, current_year: int) -> ValidationResult:
         """Validate date format and reasonableness."""
         issues = []
         warnings = []
@@ -203,7 +244,7 @@ class ContractValidator:
         
         # Check format
         try:
-            parsed_date = datetime.strptime(date_str, '%Y-%m-%d')
+            parsed_date = _parse_iso_date(date_str)
         except ValueError:
             issues.append(f"{field_name} has invalid format (expected YYYY-MM-DD)")
             return ValidationResult(
@@ -215,7 +256,6 @@ class ContractValidator:
             )
         
         # Check reasonableness
-        current_year = datetime.now().year
         year = parsed_date.year
         
         if year < 1950:
@@ -277,7 +317,7 @@ class ContractValidator:
         if not country or len(country.strip()) < 2:
             issues.append("Country is empty")
             confidence = 0.0
-        elif country not in self.VALID_COUNTRIES:
+        elif country.strip().casefold() not in self._VALID_COUNTRIES_CASEFOLD:
             warnings.append(f"Country '{country}' not in known list")
             confidence = 70.0
         
@@ -305,8 +345,8 @@ class ContractValidator:
         # Date order validation
         try:
             if signed_date and start_date:
-                signed = datetime.strptime(signed_date, '%Y-%m-%d')
-                start = datetime.strptime(start_date, '%Y-%m-%d')
+                signed = _parse_iso_date(signed_date)
+                start = _parse_iso_date(start_date)
                 
                 if signed > start:
                     warnings.append("Signed date is after start date")
@@ -318,8 +358,8 @@ class ContractValidator:
                     confidence = min(confidence, 85.0)
             
             if start_date and end_date:
-                start = datetime.strptime(start_date, '%Y-%m-%d')
-                end = datetime.strptime(end_date, '%Y-%m-%d')
+                start = _parse_iso_date(start_date)
+                end = _parse_iso_date(end_date)
                 
                 if end <= start:
                     issues.append("End date is before or equal to start date")
@@ -367,7 +407,7 @@ class ContractValidator:
         confidence = 100.0
         
         # Check for repeated characters
-        if party and re.search(r'(.)\1{4,}', party):
+        if party and _REPEATED_CHAR_RE.search(party):
             warnings.append("Party name has repeated characters")
             confidence = min(confidence, 70.0)
         
@@ -377,12 +417,12 @@ class ContractValidator:
             confidence = min(confidence, 85.0)
         
         # Check for special characters
-        if party and re.search(r'[^\w\s\-\.\,\&]', party):
+        if party and _UNUSUAL_CHAR_RE.search(party):
             warnings.append("Party name contains unusual characters")
             confidence = min(confidence, 80.0)
         
         # Check for numbers in contract type (unusual)
-        if contract_type and re.search(r'\d', contract_type):
+        if contract_type and _DIGIT_RE.search(contract_type):
             warnings.append("Contract type contains numbers")
             confidence = min(confidence, 85.0)
         
@@ -407,23 +447,10 @@ class ContractValidator:
         llm_confidence: float
     ) -> float:
         """Calculate weighted overall confidence score."""
-        weights = {
-            'party': 0.20,
-            'contract_type': 0.15,
-            'signed_date': 0.15,
-            'start_date': 0.10,
-            'end_date': 0.10,
-            'address': 0.10,
-            'country': 0.10,
-            'cross_validation': 0.05,
-            'ocr_quality': 0.025,
-            'llm_confidence': 0.025
-        }
-        
         weighted_sum = 0.0
         total_weight = 0.0
         
-        for field, weight in weights.items():
+        for field, weight in self.CONFIDENCE_WEIGHTS.items():
             if field in results:
                 weighted_sum += results[field].confidence * weight
                 total_weight += weight
@@ -433,9 +460,12 @@ class ContractValidator:
         else:
             base_confidence = initial_confidence
         
-        # Apply penalties for issues
-        issue_count = sum(len(r.issues) for r in results.values())
-        warning_count = sum(len(r.warnings) for r in results.values())
+        # Apply penalties for issues (single pass over results)
+        issue_count = 0
+        warning_count = 0
+        for result in results.values():
+            issue_count += len(result.issues)
+            warning_count += len(result.warnings)
         
         penalty = (issue_count * 5) + (warning_count * 2)
         final_confidence = max(0.0, base_confidence - penalty)
@@ -513,6 +543,10 @@ class ContractValidator:
             return "#ef4444"  # red
 
 
+# Shared instance for the convenience functions (the validator keeps no per-contract state)
+_default_validator = ContractValidator()
+
+
 # Convenience function
 def validate_contract(
     party: str,
@@ -531,8 +565,7 @@ def validate_contract(
     
     This is the main entry point for validation.
     """
-    validator = ContractValidator()
-    return validator.validate_all_fields(
+    return _default_validator.validate_all_fields(
         party=party,
         contract_type=contract_type,
         signed_date=signed_date,
@@ -544,3 +577,20 @@ def validate_contract(
         ocr_quality=ocr_quality,
         llm_confidence=llm_confidence
     )
+
+
+_VALIDATE_CONTRACT_ARGS = frozenset(inspect.signature(validate_contract).parameters)
+
+
+def validate_contracts_batch(rows: Iterable[Dict[str, Any]]) -> List[FieldValidation]:
+    """
+    Validate many contracts with validate_contract.
+    
+    Each row maps validate_contract's argument names to values. Other keys
+    (id, filename, ...) are ignored, so DataFrame.to_dict('records') rows
+    can be passed as they are. Results keep the input order.
+    """
+    return [
+        validate_contract(**{key: value for key, value in row.items() if key in _VALIDATE_CONTRACT_ARGS})
+        for row in rows
+    ]
@@ -3,12 +3,86 @@ Web Enrichment Service
 Searches the internet for missing company information (address, country) when data is incomplete.
 """
 
+import asyncio
 import re
+import threading
 import requests
-from typing import Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from config import DATA_DIR
 from logger import logger
 import time
 
+try:
+    import aiohttp  # optional: concurrent lookups in enrich_many
+except Exception:
+    aiohttp = None
+
+try:
+    import diskcache  # optional: persistent lookup cache across runs
+except Exception:
+    diskcache = None
+
+DUCKDUCKGO_URL = "https://api.duckduckgo.com/"
+
+ENRICHMENT_CACHE_DIR = DATA_DIR / "enrichment_cache"
+ENRICHMENT_CACHE_TTL = 60 * 60 * 24 * 30  # 30 days
+# Companies DDG knows nothing about are retried after 1, then 7, then 30 days
+ENRICHMENT_NEGATIVE_TTLS = (60 * 60 * 24, 60 * 60 * 24 * 7, ENRICHMENT_CACHE_TTL)
+ENRICHMENT_CACHE_SIZE_LIMIT = 50 * 1024 * 1024
+ENRICHMENT_MEMORY_CACHE_SIZE = 1024  # companies kept in-process (LRU)
+ENRICHMENT_HTTP_POOL_SIZE = 50  # keep-alive connections to DDG, shared by the sync and async paths
+
+# Pattern: "headquarters in [location]" or "located in [location]"
+# The location starts with a non-space so it can't trade characters with the \s+ before it
+# (that overlap made long runs of whitespace backtrack quadratically).
+_ADDRESS_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"headquarters?\s+(?:in|at)\s+([^.,\s][^.,]*(?:,[^.,]+){1,3})",
+    r"located\s+(?:in|at)\s+([^.,\s][^.,]*(?:,[^.,]+){1,3})",
+    r"based\s+(?:in|at)\s+([^.,\s][^.,]*(?:,[^.,]+){1,3})",
+    r"office\s+(?:in|at)\s+([^.,\s][^.,]*(?:,[^.,]+){1,3})",
+    r"(?:address|Address):\s*([^.]+)",
+))
+
+# List of common countries, in match priority order
+_COUNTRIES = (
+    "United States", "USA", "Turkey", "Türkiye", "United Kingdom", "UK",
+    "Germany", "France", "Italy", "Spain", "Netherlands", "Belgium",
+    "Sweden", "Norway", "Denmark", "Finland", "Poland", "Switzerland",
+    "Austria", "Ireland", "Portugal", "Greece", "Czech Republic",
+    "India", "China", "Japan", "South Korea", "Singapore", "Malaysia",
+    "Australia", "New Zealand", "Canada", "Brazil", "Mexico", "Argentina",
+    "Russia", "Ukraine", "Kazakhstan", "UAE", "Saudi Arabia", "Egypt",
+    "Israel", "Estonia", "Latvia", "Lithuania", "Romania", "Bulgaria"
+)
+# Normalize variants
+_COUNTRY_CANONICAL = {
+    "USA": "United States",
+    "UK": "United Kingdom",
+    "Türkiye": "Turkey",
+}
+_COUNTRY_NEEDLES = tuple((country.lower(), _COUNTRY_CANONICAL.get(country, country)) for country in _COUNTRIES)
+
+# Address completeness signals: a house number, a postal code, and "street, city" separators
+_RE_STREET_NUMBER = re.compile(r"\b\d{1,5}\b")
+_RE_POSTAL_CODE = re.compile(r"\b\d{4,6}\b")
+_ADDRESS_MIN_SCORE = 2
+
+
+def _address_score(address: str) -> int:
+    """How complete an address looks (0-3), from cheap regex signals"""
+    return (bool(_RE_STREET_NUMBER.search(address))
+            + bool(_RE_POSTAL_CODE.search(address))
+            + ("," in address))
+
+
+_RE_HTML_TAG = re.compile(r"<[^>]+>")
+_RE_WHITESPACE = re.compile(r"\s+")
+
 
 class WebEnrichmentService:
     """Searches web for missing company information"""
@@ -18,7 +92,100 @@ class WebEnrichmentService:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        # One keep-alive pool big enough for the bulk/threaded lookups, so concurrent
+        # requests reuse connections instead of opening (and dropping) extra ones.
+        # requests already sends "Accept-Encoding: gzip, deflate" (plus br when brotli is installed).
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=ENRICHMENT_HTTP_POOL_SIZE,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        self.session.mount('https://', adapter)
         self.timeout = 10
+        # Lookup cache: bounded in-process LRU in front of an optional on-disk cache,
+        # which is opened on first use. Entries are {"result", "misses", "expires"};
+        # empty results are cached too, with a TTL that grows on each repeated miss.
+        self._mem: "OrderedDict[str, Dict]" = OrderedDict()
+        self._disk = None
+        self._disk_opened = False
+        self._cache_lock = threading.Lock()
+        # Lookups currently running, by cache key (shared by the sync and async paths)
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+    
+    @staticmethod
+    def _open_disk_cache():
+        """Open the persistent lookup cache, or None if unavailable"""
+        if diskcache is None:
+            return None
+        try:
+            return diskcache.Cache(str(ENRICHMENT_CACHE_DIR), size_limit=ENRICHMENT_CACHE_SIZE_LIMIT)
+        except Exception as e:
+            logger.warning(f"Enrichment disk cache disabled: {e}")
+            return None
+    
+    @staticmethod
+    def _cache_key(company_name: str) -> str:
+        return company_name.strip().lower()
+    
+    def _get_disk_cache(self):
+        """The persistent cache, opened on the first lookup"""
+        if not self._disk_opened:
+            with self._cache_lock:
+                if not self._disk_opened:
+                    self._disk = self._open_disk_cache()
+                    self._disk_opened = True
+        return self._disk
+    
+    def _remember(self, key: str, entry: Dict):
+        with self._cache_lock:
+            self._mem[key] = entry
+            self._mem.move_to_end(key)
+            if len(self._mem) > ENRICHMENT_MEMORY_CACHE_SIZE:
+                self._mem.popitem(last=False)
+    
+    def _cache_entry(self, key: str) -> Optional[Dict]:
+        """Cache entry for a key, expired or not, or None if there is none"""
+        with self._cache_lock:
+            entry = self._mem.get(key)
+            if entry is not None:
+                self._mem.move_to_end(key)
+                return entry
+        
+        disk = self._get_disk_cache()
+        if disk is not None:
+            try:
+                entry = disk.get(key)
+            except Exception as e:
+                logger.debug(f"Enrichment cache read error: {e}")
+            # Bare results written by older versions count as misses
+            if isinstance(entry, dict) and "result" in entry:
+                self._remember(key, entry)
+                return entry
+        return None
+    
+    def _cache_get(self, company_name: str) -> Optional[Dict[str, str]]:
+        """Cached search result for a company, or None on a miss"""
+        entry = self._cache_entry(self._cache_key(company_name))
+        if entry is None or entry["expires"] <= time.time():
+            return None
+        return entry["result"]
+    
+    def _cache_set(self, company_name: str, result: Dict[str, str]):
+        """Remember a search result; empty ones back off 1d -> 7d -> 30d"""
+        key = self._cache_key(company_name)
+        misses, ttl, keep = 0, ENRICHMENT_CACHE_TTL, ENRICHMENT_CACHE_TTL
+        if not result["address"] and not result["country"]:
+            previous = self._cache_entry(key)
+            misses = previous["misses"] + 1 if previous is not None else 1
+            ttl = ENRICHMENT_NEGATIVE_TTLS[min(misses, len(ENRICHMENT_NEGATIVE_TTLS)) - 1]
+            # Keep the entry on disk past its retry time so the miss count survives
+            keep = ttl + ENRICHMENT_CACHE_TTL
+        entry = {"result": result, "misses": misses, "expires": time.time() + ttl}
+        self._remember(key, entry)
+        disk = self._get_disk_cache()
+        if disk is not None:
+            try:
+                disk.set(key, entry, expire=keep)
+            except Exception as e:
+                logger.debug(f"Enrichment cache write error: {e}")
     
     def enrich_company_data(self, company_name: str, current_address: str = "", current_country: str = "") -> Dict[str, str]:
         """
@@ -32,98 +199,242 @@ class WebEnrichmentService:
         Returns:
             Dict with enriched 'address' and 'country' fields
         """
-        if not company_name or company_name.strip() in ["-", ""]:
+        if not self._needs_lookup(company_name, current_address, current_country):
             return {"address": current_address, "country": current_country}
         
-        # Skip if we already have both
-        if current_address and len(current_address) > 10 and current_country:
+        try:
+            # Try DuckDuckGo Instant Answer API (no API key needed)
+            enriched = self._lookup(company_name)
+            if enriched is not None:
+                return self._merge_result(enriched, current_address, current_country)
+        except Exception as e:
+            logger.warning(f"Web enrichment failed: {e}")
+        
+        # Return original if search failed
+        return {"address": current_address, "country": current_country}
+    
+    def _claim_lookup(self, key: str) -> Tuple[Future, bool]:
+        """
+        In-flight future for a company and whether the caller owns it.
+        The owner runs the request; everyone else waits for its result.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future, False
+            future = self._inflight[key] = Future()
+            return future, True
+    
+    def _release_lookup(self, key: str, future: Future, result: Optional[Dict[str, str]]):
+        with self._inflight_lock:
+            del self._inflight[key]
+        future.set_result(result)
+    
+    def _lookup(self, company_name: str) -> Optional[Dict[str, str]]:
+        """
+        Cached or fresh search result for a company, None if the request failed.
+        Concurrent callers for the same company share one request.
+        """
+        cached = self._cache_get(company_name)
+        if cached is not None:
+            return cached
+        
+        key = self._cache_key(company_name)
+        future, owner = self._claim_lookup(key)
+        if not owner:
+            return future.result()
+        
+        result = None
+        try:
+            # Another caller may have finished this company since our cache miss
+            result = self._cache_get(company_name) or self._search_duckduckgo(company_name)
+        finally:
+            self._release_lookup(key, future, result)
+        return result
+    
+    async def enrich_many(self, items: List[Tuple[str, str, str]]) -> List[Dict[str, str]]:
+        """
+        Enrich several companies concurrently.
+        
+        Args:
+            items: (company_name, current_address, current_country) tuples
+        
+        Returns:
+            One dict per item, in input order, shaped like enrich_company_data's result
+        """
+        if aiohttp is None:
+            # No aiohttp: run the blocking lookups on worker threads instead
+            tasks = [asyncio.to_thread(self.enrich_company_data, *item) for item in items]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        else:
+            connector = aiohttp.TCPConnector(limit=ENRICHMENT_HTTP_POOL_SIZE)
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                             headers=dict(self.session.headers)) as session:
+                tasks = [self._enrich_company_data_async(session, *item) for item in items]
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        enriched = []
+        for (company_name, current_address, current_country), result in zip(items, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Web enrichment failed for '{company_name}': {result}")
+                result = {"address": current_address, "country": current_country}
+            enriched.append(result)
+        return enriched
+    
+    async def _enrich_company_data_async(self, session, company_name: str, current_address: str = "",
+                                         current_country: str = "") -> Dict[str, str]:
+        """Async counterpart of enrich_company_data using a shared aiohttp session"""
+        if not self._needs_lookup(company_name, current_address, current_country):
+            return {"address": current_address, "country": current_country}
+        
+        enriched = await self._lookup_async(session, company_name)
+        if enriched is None:
             return {"address": current_address, "country": current_country}
+        return self._merge_result(enriched, current_address, current_country)
+    
+    async def _lookup_async(self, session, company_name: str) -> Optional[Dict[str, str]]:
+        """Async counterpart of _lookup; shares in-flight requests with the sync path"""
+        cached = self._cache_get(company_name)
+        if cached is not None:
+            return cached
         
+        key = self._cache_key(company_name)
+        future, owner = self._claim_lookup(key)
+        if not owner:
+            # shield: a cancelled waiter must not cancel the request others are waiting on
+            return await asyncio.shield(asyncio.wrap_future(future))
+        
+        result = None
+        try:
+            result = self._cache_get(company_name) or await self._search_duckduckgo_async(session, company_name)
+        finally:
+            self._release_lookup(key, future, result)
+        return result
+    
+    async def _search_duckduckgo_async(self, session, company_name: str) -> Optional[Dict[str, str]]:
+        """Async DuckDuckGo lookup, None if the request failed"""
         logger.info(f"🌐 Web enrichment: Searching for '{company_name}'")
         
         try:
-            # Try DuckDuckGo Instant Answer API (no API key needed)
-            enriched = self._search_duckduckgo(company_name)
-            
-            if enriched["address"] or enriched["country"]:
-                logger.info(f"✅ Found: {enriched['country']} - {enriched['address'][:50]}...")
-                return {
-                    "address": enriched["address"] or current_address,
-                    "country": enriched["country"] or current_country
-                }
+            async with session.get(DUCKDUCKGO_URL, params=self._duckduckgo_params(company_name)) as response:
+                response.raise_for_status()
+                # DDG answers with application/x-javascript, so skip aiohttp's content-type check
+                data = await response.json(content_type=None)
+            result = self._parse_duckduckgo(data)
+            self._cache_set(company_name, result)
+            return result
         except Exception as e:
             logger.warning(f"Web enrichment failed: {e}")
         
-        # Return original if search failed
+        return None
+    
+    @staticmethod
+    def _needs_lookup(company_name: str, current_address: str, current_country: str) -> bool:
+        """Whether a web search is worth doing for this company"""
+        if not company_name or company_name.strip() in ["-", ""]:
+            return False
+        
+        # Skip if we already have both (same completeness gate as _needs_enrichment)
+        if current_address and current_country and _address_score(current_address) >= _ADDRESS_MIN_SCORE:
+            return False
+        
+        return True
+    
+    @staticmethod
+    def _merge_result(enriched: Dict[str, str], current_address: str, current_country: str) -> Dict[str, str]:
+        """Prefer freshly found values, keep the current ones otherwise"""
+        if enriched["address"] or enriched["country"]:
+            logger.info(f"✅ Found: {enriched['country']} - {enriched['address'][:50]}...")
+            return {
+                "address": enriched["address"] or current_address,
+                "country": enriched["country"] or current_country
+            }
         return {"address": current_address, "country": current_country}
     
-    def _search_duckduckgo(self, company_name: str) -> Dict[str, str]:
+    @staticmethod
+    def _duckduckgo_params(company_name: str) -> Dict[str, object]:
+        """Query parameters for the DuckDuckGo Instant Answer API"""
+        return {
+            "q": f"{company_name} address headquarters",
+            "format": "json",
+            "no_redirect": 1,
+            "no_html": 1,
+            "skip_disambig": 1
+        }
+    
+    def _search_duckduckgo(self, company_name: str) -> Optional[Dict[str, str]]:
         """
         Use DuckDuckGo Instant Answer API to find company info.
-        Free, no API key required.
+        Free, no API key required. Returns None if the request failed.
         """
-        result = {"address": "", "country": ""}
+        logger.info(f"🌐 Web enrichment: Searching for '{company_name}'")
         
         try:
-            # DuckDuckGo Instant Answer API
-            url = "https://api.duckduckgo.com/"
-            params = {
-                "q": f"{company_name} address headquarters",
-                "format": "json",
-                "no_redirect": 1,
-                "no_html": 1,
-                "skip_disambig": 1
-            }
-            
-            response = self.session.get(url, params=params, timeout=self.timeout)
+            response = self.session.get(DUCKDUCKGO_URL, params=self._duckduckgo_params(company_name),
+                                        timeout=self.timeout)
             response.raise_for_status()
-            data = response.json()
-            
-            # Extract from Abstract or Infobox
-            abstract = data.get("Abstract", "")
-            infobox = data.get("Infobox", {})
-            
-            # Try to extract address from abstract
-            if abstract:
-                address = self._extract_address_from_text(abstract)
-                if address:
-                    result["address"] = address
-                
-                country = self._extract_country_from_text(abstract)
-                if country:
-                    result["country"] = country
+            result = self._parse_duckduckgo(response.json())
+            self._cache_set(company_name, result)
+            return result
+        except Exception as e:
+            logger.debug(f"DuckDuckGo search error: {e}")
+        
+        return None
+    
+    def _parse_duckduckgo(self, data: Dict) -> Dict[str, str]:
+        """Pull address/country out of an Instant Answer API response"""
+        result = {"address": "", "country": ""}
+        
+        # Extract from Abstract or Infobox
+        abstract = data.get("Abstract", "")
+        infobox = data.get("Infobox", {})
+        
+        # Try to extract address from abstract
+        if abstract:
+            address = self._extract_address_from_text(abstract)
+            if address:
+                result["address"] = address
             
-            # Try infobox (structured data)
-            if isinstance(infobox, dict):
-                for item in infobox.get("content", []):
-                    if isinstance(item, dict):
-                        label = item.get("label", "").lower()
-                        value = item.get("value", "")
-                        
-                        if "headquarters" in label or "location" in label or "address" in label:
-                            if value and not result["address"]:
-                                result["address"] = self._clean_text(value)
-                        
-                        if "country" in label:
-                            if value and not result["country"]:
-                                result["country"] = self._clean_text(value)
+            country = self._extract_country_from_text(abstract)
+            if country:
+                result["country"] = country
             
-            # Fallback: Try RelatedTopics
-            if not result["address"] and not result["country"]:
-                for topic in data.get("RelatedTopics", []):
-                    if isinstance(topic, dict):
-                        text = topic.get("Text", "")
-                        if text:
-                            if not result["address"]:
-                                result["address"] = self._extract_address_from_text(text)
-                            if not result["country"]:
-                                result["country"] = self._extract_country_from_text(text)
-                            
-                            if result["address"] and result["country"]:
-                                break
+            # Infobox and RelatedTopics only fill empty fields
+            if result["address"] and result["country"]:
+                return result
         
-        except Exception as e:
-            logger.debug(f"DuckDuckGo search error: {e}")
+        # Try infobox (structured data)
+        if isinstance(infobox, dict):
+            for item in infobox.get("content", []):
+                if isinstance(item, dict):
+                    label = item.get("label", "").lower()
+                    value = item.get("value", "")
+                    
+                    if "headquarters" in label or "location" in label or "address" in label:
+                        if value and not result["address"]:
+                            result["address"] = self._clean_text(value)
+                    
+                    if "country" in label:
+                        if value and not result["country"]:
+                            result["country"] = self._clean_text(value)
+                    
+                    if result["address"] and result["country"]:
+                        break
+        
+        # Fallback: Try RelatedTopics
+        if not result["address"] and not result["country"]:
+            for topic in data.get("RelatedTopics", []):
+                if isinstance(topic, dict):
+                    text = topic.get("Text", "")
+                    if text:
+                        if not result["address"]:
+                            result["address"] = self._extract_address_from_text(text)
+                        if not result["country"]:
+                            result["country"] = self._extract_country_from_text(text)
+                        
+                        if result["address"] and result["country"]:
+                            break
         
         return result
     
@@ -132,21 +443,12 @@ class WebEnrichmentService:
         if not text:
             return ""
         
-        # Pattern: "headquarters in [location]" or "located in [location]"
-        patterns = [
-            r"headquarters?\s+(?:in|at)\s+([^.,]+(?:,\s*[^.,]+){1,3})",
-            r"located\s+(?:in|at)\s+([^.,]+(?:,\s*[^.,]+){1,3})",
-            r"based\s+(?:in|at)\s+([^.,]+(?:,\s*[^.,]+){1,3})",
-            r"office\s+(?:in|at)\s+([^.,]+(?:,\s*[^.,]+){1,3})",
-            r"(?:address|Address):\s*([^.]+)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _ADDRESS_PATTERNS:
+            match = pattern.search(text)
             if match:
                 address = match.group(1).strip()
                 # Clean up
-                address = re.sub(r"\s+", " ", address)
+                address = _RE_WHITESPACE.sub(" ", address)
                 if len(address) > 15:  # Minimum reasonable address length
                     return address
         
@@ -157,31 +459,11 @@ class WebEnrichmentService:
         if not text:
             return ""
         
-        # List of common countries
-        countries = [
-            "United States", "USA", "Turkey", "Türkiye", "United Kingdom", "UK",
-            "Germany", "France", "Italy", "Spain", "Netherlands", "Belgium",
-            "Sweden", "Norway", "Denmark", "Finland", "Poland", "Switzerland",
-            "Austria", "Ireland", "Portugal", "Greece", "Czech Republic",
-            "India", "China", "Japan", "South Korea", "Singapore", "Malaysia",
-            "Australia", "New Zealand", "Canada", "Brazil", "Mexico", "Argentina",
-            "Russia", "Ukraine", "Kazakhstan", "UAE", "Saudi Arabia", "Egypt",
-            "Israel", "Estonia", "Latvia", "Lithuania", "Romania", "Bulgaria"
-        ]
-        
         text_lower = text.lower()
         
-        for country in countries:
-            if country.lower() in text_lower:
-                # Normalize variants
-                if country in ["USA", "United States"]:
-                    return "United States"
-                elif country in ["UK", "United Kingdom"]:
-                    return "United Kingdom"
-                elif country in ["Türkiye", "Turkey"]:
-                    return "Turkey"
-                else:
-                    return country
+        for needle, country in _COUNTRY_NEEDLES:
+            if needle in text_lower:
+                return country
         
         return ""
     
@@ -191,17 +473,33 @@ class WebEnrichmentService:
             return ""
         
         # Remove HTML tags
-        text = re.sub(r"<[^>]+>", "", text)
+        text = _RE_HTML_TAG.sub("", text)
         # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text)
+        text = _RE_WHITESPACE.sub(" ", text)
         # Remove leading/trailing punctuation
         text = text.strip(" .,;")
         
         return text
 
 
-# Global instance
-enrichment_service = WebEnrichmentService()
+# Global instance (lazy)
+@lru_cache(maxsize=1)
+def get_service() -> WebEnrichmentService:
+    """Shared service, created on first use so importing this module opens no HTTP session"""
+    return WebEnrichmentService()
+
+
+def _needs_enrichment(company_name: str, address: str, country: str) -> bool:
+    """Only enrich if data is missing or insufficient"""
+    if not company_name or company_name.strip() in ["-", ""]:
+        return False
+    
+    if not address or _address_score(address) < _ADDRESS_MIN_SCORE:
+        return True
+    if not country or country.strip() in ["", "Unknown"]:
+        return True
+    
+    return False
 
 
 def enrich_missing_data(company_name: str, address: str, country: str) -> Tuple[str, str]:
@@ -211,27 +509,60 @@ def enrich_missing_data(company_name: str, address: str, country: str) -> Tuple[
     Returns:
         Tuple[address, country]
     """
-    if not company_name or company_name.strip() in ["-", ""]:
-        return address, country
-    
-    # Only enrich if data is missing or insufficient
-    needs_enrichment = False
-    if not address or len(address.strip()) < 10:
-        needs_enrichment = True
-    if not country or country.strip() in ["", "Unknown"]:
-        needs_enrichment = True
-    
-    if not needs_enrichment:
+    if not _needs_enrichment(company_name, address, country):
         return address, country
     
     try:
-        enriched = enrichment_service.enrich_company_data(company_name, address, country)
+        enriched = get_service().enrich_company_data(company_name, address, country)
         return enriched.get("address", address), enriched.get("country", country)
     except Exception as e:
         logger.error(f"Enrichment error: {e}")
         return address, country
 
 
+def enrich_missing_data_bulk(rows: List[Tuple[str, str, str]], max_workers: int = 8) -> List[Tuple[str, str]]:
+    """
+    enrich_missing_data over many (company_name, address, country) rows.
+    
+    Each distinct company is looked up once, on a bounded thread pool, and the
+    result is applied to every row that names it.
+    
+    Returns:
+        One (address, country) tuple per row, in input order
+    """
+    results = [(address, country) for _, address, country in rows]
+    
+    # Rows that need a lookup, grouped by normalized company name
+    pending: Dict[str, List[int]] = {}
+    for i, (company_name, address, country) in enumerate(rows):
+        if (_needs_enrichment(company_name, address, country)
+                and WebEnrichmentService._needs_lookup(company_name, address, country)):
+            pending.setdefault(company_name.strip().lower(), []).append(i)
+    
+    if not pending:
+        return results
+    
+    service = get_service()
+    
+    def lookup(indices: List[int]) -> Dict[str, str]:
+        # No current values: the result is exactly what the search found
+        return service.enrich_company_data(rows[indices[0]][0])
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+        futures = {executor.submit(lookup, indices): indices for indices in pending.values()}
+        for future in as_completed(futures):
+            try:
+                enriched = future.result()
+            except Exception as e:
+                logger.error(f"Enrichment error: {e}")
+                continue
+            for i in futures[future]:
+                address, country = results[i]
+                results[i] = (enriched.get("address") or address, enriched.get("country") or country)
+    
+    return results
+
+
 if __name__ == "__main__":
     # Test
     import sys
@@ -239,7 +570,7 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         company = " ".join(sys.argv[1:])
         print(f"Searching for: {company}")
-        result = enrichment_service.enrich_company_data(company)
+        result = get_service().enrich_company_data(company)
         print(f"Address: {result['address']}")
         print(f"Country: {result['country']}")
     else:
@@ -250,10 +581,10 @@ if __name__ == "__main__":
             "Nokia",
         ]
         
-        for company in test_companies:
+        # Looked up concurrently; the handful of demo companies stays well under DDG's limits
+        results = asyncio.run(get_service().enrich_many([(company, "", "") for company in test_companies]))
+        for company, result in zip(test_companies, results):
             print(f"\n{'='*60}")
             print(f"Testing: {company}")
-            result = enrichment_service.enrich_company_data(company)
             print(f"Address: {result['address']}")
             print(f"Country: {result['country']}")
-            time.sleep(2)  # Rate limiting
@@ -8,6 +8,7 @@ import sys
 # Add src_python to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src_python'))
 
+
 def test_pdf_quality_checker():
     """PDF Quality Checker testi"""
     print("\n" + "="*60)
@@ -23,6 +24,7 @@ def test_pdf_quality_checker():
     
     if os.path.exists(test_pdf):
         report = checker.analyze(test_pdf)
+        assert 0 <= report.score <= 100
         
         print(f"\n✅ Kalite Skoru: {report.score}/100")
         print(f"📄 Sayfa Sayısı: {report.page_count}")
@@ -62,6 +64,7 @@ def test_file_renamer():
     
     for old_name, data in test_files:
         new_name = renamer.suggest_rename(old_name, data)
+        assert new_name.endswith(".pdf")
         print(f"  {old_name}")
         print(f"  → {new_name}")
         print()
@@ -69,20 +72,19 @@ def test_file_renamer():
     print("✅ SmartFileRenamer modülü başarıyla çalıştı")
 
 
-def test_feedback_service():
+def test_feedback_service(db_session):
     """Feedback Service testi"""
     print("\n" + "="*60)
     print("📊 TEST 3: Feedback Service")
     print("="*60)
     
     from src_python.feedback_service import FeedbackService
-    from src_python.database import SessionLocal
     
-    db = SessionLocal()
-    service = FeedbackService(db)
+    service = FeedbackService(db_session)
     
     # Accuracy raporu
     report = service.get_overall_accuracy(days=30)
+    assert {'overall', 'signing_party', 'address', 'country'} <= set(report)
     
     print(f"\n📈 Son 30 Günlük Doğruluk:")
     print(f"  Genel: {report['overall']['accuracy']:.1f}%")
@@ -94,7 +96,6 @@ def test_feedback_service():
         if field != 'overall':
             print(f"  {field}: {stats['accuracy']:.1f}%")
     
-    db.close()
     print("\n✅ FeedbackService modülü başarıyla çalıştı")
 
 
@@ -124,30 +125,27 @@ def test_api_endpoints():
     print("  3. Endpoint'leri dene")
 
 
-def test_database():
+def test_database(db_session):
     """Veritabanı tablolarını test et"""
     print("\n" + "="*60)
     print("🗄️ TEST 5: Database Tables")
     print("="*60)
     
-    from src_python.database import SessionLocal
     from src_python.models import AnalysisJob, Contract, Correction, ExtractionPattern
     
-    db = SessionLocal()
-    
     # Tablo sayılarını kontrol et
     tables_info = [
-        ("AnalysisJob", db.query(AnalysisJob).count()),
-        ("Contract", db.query(Contract).count()),
-        ("Correction", db.query(Correction).count()),
-        ("ExtractionPattern", db.query(ExtractionPattern).count()),
+        ("AnalysisJob", db_session.query(AnalysisJob).count()),
+        ("Contract", db_session.query(Contract).count()),
+        ("Correction", db_session.query(Correction).count()),
+        ("ExtractionPattern", db_session.query(ExtractionPattern).count()),
     ]
     
     print("\n📊 Veritabanı İstatistikleri:\n")
     for table_name, count in tables_info:
+        assert count >= 0
         print(f"  {table_name}: {count} kayıt")
     
-    db.close()
     print("\n✅ Tüm tablolar başarıyla oluşturuldu")
 
 
@@ -157,6 +155,10 @@ def main():
     print("🧪 CONTRACTSAI - YENİ ÖZELLİKLER TEST SÜİTİ")
     print("="*70)
     
+    from src_python.database import SessionLocal
+    
+    db = SessionLocal()
+    
     try:
         test_pdf_quality_checker()
     except Exception as e:
@@ -168,7 +170,7 @@ def main():
         print(f"❌ File Renamer Test Failed: {e}")
     
     try:
-        test_feedback_service()
+        test_feedback_service(db)
     except Exception as e:
         print(f"❌ Feedback Service Test Failed: {e}")
     
@@ -178,10 +180,12 @@ def main():
         print(f"❌ API Test Failed: {e}")
     
     try:
-        test_database()
+        test_database(db)
     except Exception as e:
         print(f"❌ Database Test Failed: {e}")
     
+    db.close()
+    
     print("\n" + "="*70)
     print("✅ TÜM TESTLER TAMAMLANDI!")
     print("="*70)
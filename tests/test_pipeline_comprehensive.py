@@ -12,15 +12,22 @@ from pipeline import PipelineManager
 class TestPipelineManager:
     """Unit tests for PipelineManager class."""
     
-    @pytest.fixture
-    def pipeline(self):
-        """Create a PipelineManager instance with mocked dependencies."""
+    @pytest.fixture(scope="class")
+    def pipeline_manager(self):
+        """Create one PipelineManager instance with mocked dependencies for the class."""
         with patch('pipeline.easyocr.Reader'):
             manager = PipelineManager()
             manager.llm_client = Mock()
             manager.reader = Mock()
             return manager
     
+    @pytest.fixture
+    def pipeline(self, pipeline_manager):
+        """The shared PipelineManager with its mocks reset for each test."""
+        pipeline_manager.llm_client.reset_mock(return_value=True, side_effect=True)
+        pipeline_manager.reader.reset_mock(return_value=True, side_effect=True)
+        return pipeline_manager
+    
     def test_calculate_file_hash(self, pipeline, tmp_path):
         """Test file hash calculation."""
         # Create a temporary file
@@ -88,7 +95,7 @@ class TestPipelineManager:
         assert result == "Page 1 text\\nPage 2 text"
     
     @patch('pipeline.SessionLocal')
-    def test_process_single_file_cache_hit(self, mock_session, pipeline):
+    def test_process_single_file_cache_hit(self, mock_session, pipeline, monkeypatch):
         """Test that cached results are returned."""
         # Mock cached contract
         cached_contract = Mock()
@@ -112,8 +119,8 @@ class TestPipelineManager:
         mock_db.query.return_value = mock_query
         mock_session.return_value = mock_db
         
-        # Mock hash calculation
-        pipeline.calculate_file_hash = Mock(return_value="abc123")
+        # Mock hash calculation (monkeypatch: the manager is shared by the class)
+        monkeypatch.setattr(pipeline, "calculate_file_hash", Mock(return_value="abc123"))
         
         # Test
         result = pipeline.process_single_file("test.pdf", "/fake/path")
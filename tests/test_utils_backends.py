@@ -0,0 +1,55 @@
+import importlib.util
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# Add parent directory to path to import modules
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src_python'))
+sys.path.insert(0, SRC_DIR)
+
+from config import ADDRESS_BLACKLIST, TELENITY_MAP
+
+OPTIONAL_BACKENDS = ("hyperscan", "ahocorasick", "re2")
+
+
+def load_utils(*blocked):
+    """Load a private copy of utils.py with the given optional imports made unavailable."""
+    name = "utils_without_" + "_".join(blocked) if blocked else "utils_all_backends"
+    spec = importlib.util.spec_from_file_location(name, os.path.join(SRC_DIR, "utils.py"))
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {backend: None for backend in blocked}):
+        spec.loader.exec_module(module)
+    return module
+
+
+def sample_texts():
+    """Addresses and party strings that hit every keyword of each scan, plus near misses."""
+    keywords = list(ADDRESS_BLACKLIST) + list(TELENITY_MAP) + [
+        "istanbul", "türkiye", "estonia", "tallinn", "dubai", "uae", "india", "noida", "usa", "germany",
+    ]
+    texts = ["", "-", "Random Company", "Telenity Something", "Büyükdere Cad. No:1 Sarıyer"]
+    for keyword in keywords:
+        texts += [
+            f"Street 5, {keyword}, Floor 3",
+            f"{keyword.upper()} HQ",
+            f"prefix{keyword}suffix",
+            f"{keyword[:-1]} only",
+            f"Acme Ltd. - {keyword.title()} Office; Şişli / İstanbul",
+        ]
+    return texts
+
+
+@pytest.fixture(scope="module")
+def reference():
+    return load_utils(*OPTIONAL_BACKENDS)
+
+
+@pytest.mark.parametrize("blocked", [(), ("hyperscan",), ("re2",), ("hyperscan", "ahocorasick")])
+def test_backends_agree_with_pure_python(reference, blocked):
+    utils = load_utils(*blocked)
+    for text in sample_texts():
+        assert utils.filter_telenity_address(text) == reference.filter_telenity_address(text), text
+        assert utils.determine_telenity_entity(text) == reference.determine_telenity_entity(text), text
+        assert utils.infer_country_from_address(text) == reference.infer_country_from_address(text), text
@@ -0,0 +1,62 @@
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src_python')))
+
+import utils
+
+COMPANY_DB = {
+    "Telenity FZE": "fze",
+    "Telenity Europe Ltd": "europe",
+    "Turkcell Iletisim Hizmetleri A.S.": "turkcell",
+    "Vodafone Group PLC": "vodafone",
+    "Şişecam Ticaret": "sisecam",
+}
+
+QUERIES = [
+    "", "Telenity FZE", "fze telenity", "Telenity Europe", "TURKCELL Iletisim", "Vodafon Group",
+    "Sisecam Ticaret", "Şişecam", "Completely Unrelated", "Telenity FZE", None,
+]
+
+FILENAMES = [
+    "Contract_2023-05-12.pdf", "NDA 12.03.2021 signed.pdf", "agreement_15 Ocak 2022.docx",
+    "Sozlesme 3 Subat 2020.pdf", "no date here.pdf", "2019_report.pdf", "Contract_2023-05-12.pdf",
+]
+
+TEXTS = [
+    "Telenity FZE", "Telenity Something", "Random Company", "İstanbul Şişli Büyükdere Cad.",
+    "Dubai Internet City, UAE", "", "Telenity FZE",
+]
+
+
+def find_single(query, threshold):
+    return utils.find_best_company_match(query, COMPANY_DB, threshold) if query else None
+
+
+@pytest.mark.parametrize("threshold", [60, 80, 95])
+def test_find_best_company_matches_matches_single(threshold):
+    expected = [find_single(query, threshold) for query in QUERIES]
+    assert utils.find_best_company_matches(QUERIES, COMPANY_DB, threshold) == expected
+
+
+def test_find_best_company_matches_empty_db():
+    assert utils.find_best_company_matches(["Telenity FZE"], {}) == [None]
+
+
+@pytest.mark.parametrize("aggressive", [False, True])
+def test_extract_date_from_filename_batch(aggressive):
+    expected = [utils.extract_date_from_filename(name, aggressive) for name in FILENAMES]
+    assert utils.extract_date_from_filename_batch(FILENAMES, aggressive) == expected
+
+
+@pytest.mark.parametrize("batch, single", [
+    (utils.determine_telenity_entity_batch, utils.determine_telenity_entity),
+    (utils.clean_turkish_chars_batch, utils.clean_turkish_chars),
+    (utils.filter_telenity_address_batch, utils.filter_telenity_address),
+])
+def test_batch_helpers_match_single(batch, single):
+    assert batch(TEXTS) == [single(text) for text in TEXTS]
+    assert batch(iter(TEXTS)) == [single(text) for text in TEXTS]
@@ -0,0 +1,47 @@
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src_python')))
+
+from validation import _parse_iso_date, validate_contract, validate_contracts_batch
+
+ROWS = [
+    dict(party="Telenity FZE", contract_type="NDA", signed_date="2023-01-10", start_date="2023-01-15",
+         end_date="2024-01-15", address="Dubai Internet City, Building 5", country="UAE"),
+    dict(party="", contract_type="", signed_date="", start_date="", end_date="", address="", country=""),
+    dict(party="Acme", contract_type="Service Agreement", signed_date="2023-02-30", start_date="2025-01-01",
+         end_date="2024-01-01", address="x", country="Mars", ocr_quality=90.0, llm_confidence=20.0),
+    dict(party="Vodafone", contract_type="Reseller", signed_date="1990-5-7", start_date="1990-05-07",
+         end_date="2100-12-31", address="Kemp House, 160 City Road, London", country="UK",
+         initial_confidence=80.0, id=7, filename="vodafone.pdf"),
+]
+
+
+@pytest.mark.parametrize("date_str", [
+    "2023-01-15", "2023-1-5", "2023-01- 5", "2024-02-29", "0001-01-01", "9999-12-31", "２０２３-01-15",
+])
+def test_parse_iso_date_accepts_what_strptime_accepts(date_str):
+    assert _parse_iso_date(date_str) == datetime.strptime(date_str, "%Y-%m-%d")
+
+
+@pytest.mark.parametrize("date_str", [
+    "", "2023-02-30", "2023-13-01", "2023-00-10", "2023-01-32", "2023-01-00", "0000-01-01",
+    "23-01-15", "2023/01/15", "2023-01-15 ", " 2023-01-15", "2023-01-15T00:00", "2023-001-15",
+    "2023-01-1x",
+])
+def test_parse_iso_date_rejects_what_strptime_rejects(date_str):
+    with pytest.raises(ValueError):
+        datetime.strptime(date_str, "%Y-%m-%d")
+    with pytest.raises(ValueError):
+        _parse_iso_date(date_str)
+
+
+def test_validate_contracts_batch_matches_validate_contract():
+    args = [{key: value for key, value in row.items() if key not in ("id", "filename")} for row in ROWS]
+    expected = [validate_contract(**row) for row in args]
+    assert validate_contracts_batch(ROWS) == expected
+    assert validate_contracts_batch(iter(ROWS)) == expected
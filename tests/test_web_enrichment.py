@@ -0,0 +1,195 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src_python')))
+
+pytest.importorskip("requests")
+import web_enrichment
+
+NOKIA = {"Abstract": "", "Infobox": {"content": [
+    {"label": "Headquarters", "value": "Karaportti 3, Espoo"},
+    {"label": "Country", "value": "Finland"},
+]}}
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeGet:
+    """Stands in for Session.get: records each searched company and answers after a short delay."""
+
+    def __init__(self, answers, delay=0.05):
+        self.answers = answers
+        self.delay = delay
+        self.queries = []
+        self.lock = threading.Lock()
+
+    def __call__(self, url, params=None, timeout=None):
+        company = params["q"].split(" address")[0].strip().lower()
+        with self.lock:
+            self.queries.append(company)
+        time.sleep(self.delay)
+        if company not in self.answers:
+            raise ConnectionError(company)
+        return FakeResponse(self.answers[company])
+
+
+@pytest.fixture
+def service(monkeypatch, tmp_path):
+    monkeypatch.setattr(web_enrichment, "aiohttp", None)
+    monkeypatch.setattr(web_enrichment, "ENRICHMENT_CACHE_DIR", tmp_path / "cache")
+    svc = web_enrichment.WebEnrichmentService()
+    svc.session.get = FakeGet({"nokia": NOKIA, "unknown co": {}})
+    monkeypatch.setattr(web_enrichment, "get_service", lambda: svc)
+    return svc
+
+
+def test_enrich_company_data_fills_missing_fields(service):
+    assert service.enrich_company_data("Nokia") == {"address": "Karaportti 3, Espoo", "country": "Finland"}
+    # Found values win over the current ones
+    assert service.enrich_company_data("Nokia", "", "FI") == {"address": "Karaportti 3, Espoo", "country": "Finland"}
+    assert service.session.get.queries == ["nokia"]
+
+
+def test_failed_lookup_keeps_current_values(service):
+    assert service.enrich_company_data("Broken Co", "", "TR") == {"address": "", "country": "TR"}
+    # Failures are not cached, so the next call retries
+    service.enrich_company_data("Broken Co")
+    assert len(service.session.get.queries) == 2
+
+
+def test_cache_hits_and_empty_results(service):
+    for name in ("Nokia", " nokia ", "NOKIA", "Unknown Co", "unknown co"):
+        service.enrich_company_data(name)
+    assert service.session.get.queries == ["nokia", "unknown co"]
+
+
+def test_memory_cache_is_bounded(service, monkeypatch):
+    monkeypatch.setattr(web_enrichment, "ENRICHMENT_MEMORY_CACHE_SIZE", 2)
+    monkeypatch.setattr(web_enrichment, "diskcache", None)
+    for name in ("a", "b", "a", "c"):
+        service._cache_set(name, {"address": name, "country": ""})
+    assert list(service._mem) == ["a", "c"]
+
+
+def test_disk_cache_survives_a_new_service(service):
+    pytest.importorskip("diskcache")
+    service.enrich_company_data("Nokia")
+    fresh = web_enrichment.WebEnrichmentService()
+    fresh.session.get = service.session.get
+    assert fresh.enrich_company_data("Nokia")["country"] == "Finland"
+    assert len(service.session.get.queries) == 1
+
+
+def test_enrich_many_issues_one_request_per_company(service):
+    items = [("Nokia", "", ""), (" nokia ", "", ""), ("NOKIA", "", "FI"), ("Broken Co", "", ""),
+             ("Broken Co", "addr", "TR"), ("-", "", ""), ("Nokia", "Main Street 5, Springfield", "X")]
+    results = asyncio.run(service.enrich_many(items))
+    assert results == [
+        {"address": "Karaportti 3, Espoo", "country": "Finland"},
+        {"address": "Karaportti 3, Espoo", "country": "Finland"},
+        {"address": "Karaportti 3, Espoo", "country": "Finland"},
+        {"address": "", "country": ""},
+        {"address": "addr", "country": "TR"},
+        {"address": "", "country": ""},
+        {"address": "Main Street 5, Springfield", "country": "X"},
+    ]
+    assert sorted(service.session.get.queries) == ["broken co", "nokia"]
+
+
+def test_concurrent_threads_share_one_request(service):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(service.enrich_company_data("Nokia")))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [{"address": "Karaportti 3, Espoo", "country": "Finland"}] * 8
+    assert service.session.get.queries == ["nokia"]
+    assert service._inflight == {}
+
+
+def test_enrich_missing_data_bulk_issues_one_request_per_company(service):
+    rows = [("Nokia", "", ""), (" nokia", "Short", "Finland"), ("Nokia", "Main Street 5, Springfield", "TR"),
+            ("-", "", ""), ("Unknown Co", "", ""), ("unknown co", "", "DE")]
+    assert web_enrichment.enrich_missing_data_bulk(rows) == [
+        ("Karaportti 3, Espoo", "Finland"),
+        ("Karaportti 3, Espoo", "Finland"),
+        ("Main Street 5, Springfield", "TR"),
+        ("", ""),
+        ("", ""),
+        ("", "DE"),
+    ]
+    assert sorted(service.session.get.queries) == ["nokia", "unknown co"]
+
+
+@pytest.mark.parametrize("text, address", [
+    ("Acme is headquartered... Its headquarters in 12 Main Street, Springfield, Illinois, USA.",
+     "12 Main Street, Springfield, Illinois, USA"),
+    ("Zed is based in   Rue de la Loi 100,\n Brussels, Belgium.", "Rue de la Loi 100, Brussels, Belgium"),
+    ("Address: Karaportti 3 Espoo Finland", "Karaportti 3 Espoo Finland"),
+    ("based in  , 5 Main Street Springfield", ""),
+    ("based at " + " " * 5000, ""),
+])
+def test_extract_address_from_text(service, text, address):
+    assert service._extract_address_from_text(text) == address
+
+
+@pytest.mark.parametrize("company, address, country, expected", [
+    ("Nokia", "", "Finland", True),
+    ("Nokia", "Espoo", "Finland", True),
+    ("Nokia", "Karaportti Espoo Finland somewhere", "Finland", True),
+    ("Nokia", "Karaportti 3, Espoo", "Finland", False),
+    ("Nokia", "No 5, Ist", "TR", False),
+    ("Nokia", "Karaportti 3, 02610 Espoo", "Unknown", True),
+    ("Nokia", "Karaportti 3, 02610 Espoo", "", True),
+    ("-", "", "", False),
+])
+def test_needs_enrichment_scores_address_completeness(company, address, country, expected):
+    assert web_enrichment._needs_enrichment(company, address, country) is expected
+
+
+def test_empty_results_back_off(service, monkeypatch):
+    day = 60 * 60 * 24
+    start = time.time()
+    now = [start]
+    monkeypatch.setattr(web_enrichment.time, "time", lambda: now[0])
+    # Retries are due 1, then 7, then 30 days after each miss
+    for days, expected_requests in [(0, 1), (0.5, 1), (1.5, 2), (5, 2), (9, 3), (30, 3), (40, 4)]:
+        now[0] = start + days * day
+        service.enrich_company_data("Unknown Co")
+        assert len(service.session.get.queries) == expected_requests, days
+    # Found results keep the full 30 day TTL
+    assert service.enrich_company_data("Nokia")["country"] == "Finland"
+    now[0] += 20 * day
+    service.enrich_company_data("Nokia")
+    assert service.session.get.queries.count("nokia") == 1
+
+
+def test_incomplete_long_address_is_looked_up(service):
+    # Long, but no house number, postal code or separator: not complete enough to skip
+    address = "Karaportti Espoo Finland somewhere"
+    expected = ("Karaportti 3, Espoo", "Finland")
+    assert web_enrichment.enrich_missing_data("Nokia", address, "Finland") == expected
+    assert service.session.get.queries == ["nokia"]
+    
+    service._mem.clear()
+    service._disk = None
+    rows = [("Nokia", address, "Finland"), ("Nokia", "Karaportti 3, 02610 Espoo", "Finland")]
+    assert web_enrichment.enrich_missing_data_bulk(rows) == [expected, rows[1][1:]]
+    assert service.session.get.queries == ["nokia", "nokia"]